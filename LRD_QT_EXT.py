@@ -2,9 +2,34 @@ import sys
 import os
 import re
 import time
-import pandas as pd
+import hashlib
+import sqlite3
+import threading
+import queue
+import multiprocessing
+from dataclasses import dataclass
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+import numpy as np
+import cv2
+import torch
 import easyocr
 
+from ocr_common import IMAGE_EXTENSIONS, ExternalDetector, export_detector_onnx, letterbox
+
+try:
+    import pyexcelerate
+except ImportError:  # fall back to openpyxl in write-only (streaming) mode
+    pyexcelerate = None
+    import openpyxl
+    from openpyxl.xml import LXML
+
+try:
+    import onnxruntime as ort
+    from onnxruntime.quantization import QuantFormat, QuantType, quantize_static
+except ImportError:  # optional: the PyTorch detector is used instead
+    ort = None
+
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QFileDialog, QTextEdit, QMessageBox, QLabel, QProgressBar,
@@ -17,53 +42,497 @@ from PyQt6.QtGui import QIcon, QPixmap, QImage
 text_length_limit = None
 use_full_path = True
 
+_BAD_FILENAME_CHARS = str.maketrans("", "", '\\/*?:"<>|')
+_WS_RE = re.compile(r"\s+")
+
+# Images per readtext_batched call; every image in a batch is letterboxed onto the
+# same MAX_IMAGE_SIDE canvas so the detector runs one stacked forward pass
+# instead of N small ones.
+BATCH_SIZE = 8
+
+# OCR results keyed by image content hash, kept next to the outputs
+CACHE_DB_NAME = ".cache.db"
+
+EXCEL_COLUMNS = ["File Name", "Extracted Text", "Saved Path"]
+
+# Long-side cap applied before OCR; detector cost scales with H x W
+MAX_IMAGE_SIDE = 1024
+
+PREVIEW_SIZE = (400, 300)
+PREVIEW_CACHE_SIZE = 32
+
+# Per-file GUI updates are sent every ~total/200 files or at least this often (s)
+PROGRESS_INTERVAL = 0.25
+
+# Large CPU jobs fan OCR out to processes, each with its own reader and a small
+# BLAS thread budget, so per-process thread pools don't fight over cores
+POOL_MIN_FILES = 32
+POOL_THREADS_PER_PROCESS = 4
+
+# The INT8 detector is calibrated on the first pages of a bulk job and kept only
+# if it beats PyTorch on them: faster, with at most this share of score-map
+# pixels landing on the other side of EasyOCR's low_text threshold (0.4)
+CALIBRATION_PAGES = 8
+ONNX_MAX_MISMATCH = 0.01
+LOW_TEXT = 0.4
+
+# Batches read from disk ahead of OCR, so slow drives and network shares are
+# read while the batch threads are busy with inference
+PREFETCH_BATCHES = 8
+
 
 def sanitize_filename(name: str) -> str:
-    return re.sub(r'[\\/*?:"<>|]', "", name)
+    return name.translate(_BAD_FILENAME_CHARS)
+
+
+def read_file(path: str) -> bytes | None:
+    try:
+        with open(path, "rb") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def load_and_resize(data: bytes) -> np.ndarray | None:
+    # Decoding from memory lets the same read serve the cache hash, and unlike
+    # cv2.imread it copes with non-ASCII paths on Windows.
+    img = cv2.imdecode(np.frombuffer(data, dtype=np.uint8), cv2.IMREAD_COLOR)
+    if img is None:
+        return None
+    h, w = img.shape[:2]
+    scale = MAX_IMAGE_SIDE / max(h, w)
+    if scale < 1:
+        img = cv2.resize(img, (round(w * scale), round(h * scale)), interpolation=cv2.INTER_AREA)
+    return cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
+
+
+def preview_image(img: np.ndarray) -> QImage:
+    # Built on the worker side so the GUI thread never decodes or scales
+    h, w = img.shape[:2]
+    qimg = QImage(img.data, w, h, 3 * w, QImage.Format.Format_RGB888).scaled(
+        *PREVIEW_SIZE, Qt.AspectRatioMode.KeepAspectRatio,
+        Qt.TransformationMode.FastTransformation
+    )
+    # scaled() may share the numpy buffer when no resize is needed; copy() detaches
+    # it so the image can safely cross threads
+    return qimg.copy()
+
+
+@lru_cache(maxsize=PREVIEW_CACHE_SIZE)
+def _scaled_preview(path: str, mtime_ns: int) -> QImage:
+    data = read_file(path)
+    img = load_and_resize(data) if data else None
+    return preview_image(img) if img is not None else QImage()
+
+
+def load_preview(path: str) -> QImage:
+    # Only the files actually shown get a preview, and showing the same file
+    # again (e.g. cancel and retry) skips the decode; mtime keeps edits visible
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        return QImage()
+    return _scaled_preview(path, mtime_ns)
+
+
+# ------------------------- Excel output -------------------------
+@dataclass(slots=True)
+class Row:
+    """One result row, in EXCEL_COLUMNS order."""
+    file_name: str
+    extracted_text: str
+    saved_path: str
+
+
+class ResultSheet:
+    """Streams result rows into the Excel workbook as files finish.
+
+    Uses pyexcelerate when installed, otherwise openpyxl's write-only mode,
+    which keeps memory flat instead of building a cell object per value.
+    """
+
+    def __init__(self):
+        if pyexcelerate is not None:
+            self._wb = pyexcelerate.Workbook()
+            self._ws = self._wb.new_sheet("Extracted", data=[EXCEL_COLUMNS])
+        else:
+            self._wb = openpyxl.Workbook(write_only=True)
+            self._ws = self._wb.create_sheet("Extracted")
+            self._ws.append(EXCEL_COLUMNS)
+        self.rows = 1
+
+    def append(self, row: Row):
+        self.rows += 1
+        values = (row.file_name, row.extracted_text, row.saved_path)
+        if pyexcelerate is not None:
+            for col, value in enumerate(values, 1):
+                self._ws.set_cell_value(self.rows, col, value)
+        else:
+            self._ws.append(values)
+
+    def save(self, path: str):
+        self._wb.save(path)
+
+
+# ------------------------- ONNX detector -------------------------
+class OnnxDetector(ExternalDetector):
+    """INT8 ONNX Runtime stand-in for EasyOCR's CRAFT detector."""
+
+    def __init__(self, model_path: str, num_threads: int | None = None):
+        so = ort.SessionOptions()
+        so.intra_op_num_threads = num_threads or os.cpu_count() or 1
+        self.session = ort.InferenceSession(model_path, sess_options=so, providers=["CPUExecutionProvider"])
+
+    def run(self, x):
+        return self.session.run(None, {"image": x})
+
+    def beats(self, detector, inputs: list) -> bool:
+        """Whether this detector is faster than ``detector`` on inputs, with matching score maps."""
+        self.run(inputs[0])   # first runs pay for allocation and thread start-up
+        with torch.no_grad():
+            detector(torch.from_numpy(inputs[0]))
+        ours = theirs = 0.0
+        mismatch = 0.0
+        for x in inputs:
+            start = time.perf_counter()
+            y = self.run(x)[0]
+            ours += time.perf_counter() - start
+            start = time.perf_counter()
+            with torch.no_grad():
+                ref = detector(torch.from_numpy(x))[0].numpy()
+            theirs += time.perf_counter() - start
+            mismatch = max(mismatch, np.mean((y > LOW_TEXT) != (ref > LOW_TEXT)))
+        return ours < theirs and mismatch <= ONNX_MAX_MISMATCH
+
+    @classmethod
+    def from_reader(cls, reader, num_threads: int | None = None, sample_paths=None, log=None):
+        """Load the INT8 detector, building it once from sample pages; None to keep PyTorch.
+
+        CRAFT is almost all convolutions, so it is quantized statically (QDQ, int8
+        weights, uint8 activations) on real pages; dynamic quantization would turn
+        each Conv into a ConvInteger, which is slower than FP32 on CPU. The result
+        is benchmarked against the PyTorch detector and remembered if it loses.
+        """
+        if ort is None:
+            return None
+        model_dir = reader.model_storage_directory
+        int8_path = os.path.join(model_dir, "craft_int8.onnx")
+        rejected_path = int8_path + ".rejected"
+        if os.path.exists(int8_path):
+            return cls(int8_path, num_threads)
+        if os.path.exists(rejected_path):
+            return None
+        inputs = calibration_inputs(sample_paths or [])
+        if len(inputs) < CALIBRATION_PAGES:
+            return None   # built on a later run with enough pages
+
+        fp32_path = os.path.join(model_dir, "craft_fp32.onnx")
+        tmp_path = int8_path + ".tmp"   # so an interrupted run can't leave a broken model
+        accepted = False
+        try:
+            export_detector_onnx(reader.detector, fp32_path)
+            quantize_static(fp32_path, tmp_path, _CalibrationPages(inputs),
+                            quant_format=QuantFormat.QDQ, per_channel=True,
+                            activation_type=QuantType.QUInt8, weight_type=QuantType.QInt8)
+            detector = cls(tmp_path, num_threads)
+            accepted = detector.beats(reader.detector, inputs)
+        finally:
+            stale = [fp32_path] if accepted else [fp32_path, tmp_path]
+            for path in stale:
+                if os.path.exists(path):
+                    os.remove(path)
+            if not accepted:
+                # Remembered, so later runs don't pay for the export and benchmark again
+                open(rejected_path, "w").close()
+        if not accepted:
+            if log:
+                log("INT8 ONNX detector was slower or less accurate than PyTorch; keeping PyTorch.")
+            return None
+        os.replace(tmp_path, int8_path)
+        return detector
+
+
+class _CalibrationPages:
+    """Feeds calibration inputs to ONNX Runtime's quantize_static."""
+
+    def __init__(self, inputs: list):
+        self._inputs = iter(inputs)
+
+    def get_next(self):
+        x = next(self._inputs, None)
+        return None if x is None else {"image": x}
+
+
+def calibration_inputs(paths: list) -> list:
+    # Prepared as EasyOCR prepares detector input for a letterboxed batch image;
+    # at MAX_IMAGE_SIDE, its own resize_aspect_ratio leaves the size unchanged
+    from easyocr.imgproc import normalizeMeanVariance
+    inputs = []
+    for path in paths:
+        data = read_file(path)
+        img = load_and_resize(data) if data else None
+        if img is not None:
+            img = letterbox([img], MAX_IMAGE_SIDE)[0]
+            inputs.append(np.ascontiguousarray(normalizeMeanVariance(img).transpose(2, 0, 1)[None],
+                                               dtype=np.float32))
+            if len(inputs) == CALIBRATION_PAGES:
+                break
+    return inputs
+
+
+# ------------------------- OCR -------------------------
+def create_reader(log, num_threads: int | None = None, sample_paths=None):
+    reader = easyocr.Reader(["en"], gpu=False, cudnn_benchmark=True)  # Force CPU only
+
+    # The recognizer is already int8 (EasyOCR quantizes it on CPU); the
+    # detector is swapped for an int8 ONNX Runtime session when that is faster.
+    try:
+        detector = OnnxDetector.from_reader(reader, num_threads, sample_paths, log)
+        if detector is not None:
+            reader.detector = detector
+            log("Using INT8 ONNX Runtime text detector.")
+    except Exception as e:
+        log(f"ONNX detector unavailable, using PyTorch: {e}")
+    return reader
+
+
+def join_text(results, limit: int | None = None) -> str:
+    if not limit:
+        return _WS_RE.sub(" ", " ".join(r[1] for r in results)).strip()
+    # Fragments are collapsed one by one so the running length is exact and
+    # the rest of a long document is never joined once the limit is covered
+    words, n = [], -1
+    for r in results:
+        w = _WS_RE.sub(" ", r[1]).strip()
+        if w:
+            words.append(w)
+            n += len(w) + 1
+            if n >= limit:
+                break
+    return " ".join(words)
+
+
+def extract_batch(reader, images: list, limit: int | None = None) -> list:
+    # Undecodable images are left out so they can't fail the whole batch
+    texts = ["Error: Could not read image"] * len(images)
+    valid = [i for i, img in enumerate(images) if img is not None]
+    if not valid:
+        return texts
+    try:
+        batch_results = reader.readtext_batched(
+            letterbox([images[i] for i in valid], MAX_IMAGE_SIDE), batch_size=len(valid)
+        )
+        for i, results in zip(valid, batch_results):
+            texts[i] = join_text(results, limit)
+    except Exception:
+        # One bad image fails the whole batch; retry one by one
+        for i in valid:
+            try:
+                texts[i] = join_text(reader.readtext(images[i]), limit)
+            except Exception as e:
+                texts[i] = f"Error: {e}"
+    return texts
+
+
+# ------------------------- Process pool -------------------------
+_pool_reader = None
+
+
+def _init_pool_reader():
+    global _pool_reader
+    torch.set_num_threads(POOL_THREADS_PER_PROCESS)
+    try:
+        _pool_reader = create_reader(lambda msg: None, POOL_THREADS_PER_PROCESS)
+    except Exception:
+        # Raising here would make the pool respawn the process forever
+        _pool_reader = None
+
+
+def _ocr_batch(images: list, limit: int | None = None) -> list:
+    if _pool_reader is None:
+        return ["Error: Failed to load OCR model"] * len(images)
+    return extract_batch(_pool_reader, images, limit)
 
 
 # ------------------------- Worker -------------------------
 class OCRWorker(QThread):
     progress_step = pyqtSignal(int, int)   # processed, total
     file_done = pyqtSignal(str, str)
-    file_preview = pyqtSignal(str)
-    all_done = pyqtSignal(list, str)
+    file_preview = pyqtSignal(QImage)
+    all_done = pyqtSignal(dict, str)   # summary, output folder
     error_msg = pyqtSignal(str)
     log_msg = pyqtSignal(str)
 
-    def __init__(self, folder_path: str, scan_mode: str, specific_files=None):
+    _reader = None  # shared across jobs so the model loads once per process
+    _warmed_up = False  # set once a job has run the warm-up batch on _reader
+
+    def __init__(self, folder_path: str, scan_mode: str, specific_files=None,
+                 text_limit: int | None = None, full_path: bool = True):
         super().__init__()
         self.folder_path = folder_path
         self.scan_mode = scan_mode
         self.specific_files = specific_files
+        # Settings are fixed per job so changing them mid-run can't mix results
+        self._text_limit = text_limit
+        self._use_full_path = full_path
         self.start_time = None
-
-    def _get_reader(self):
+        self._cache_lock = threading.Lock()
+        self._claimed_folders = set()   # lower-cased output folder names claimed by this job
+        self._folder_lock = threading.Lock()
+        self._ocr_pool = None
+
+    def _get_reader(self, sample_paths: list):
+        if OCRWorker._reader is not None:
+            return OCRWorker._reader
         try:
-            return easyocr.Reader(["en"], gpu=False)  # Force CPU only
+            reader = create_reader(self.log_msg.emit, sample_paths=sample_paths)
         except Exception as e:
             self.error_msg.emit(f"Failed to load OCR model: {e}")
             return None
+        OCRWorker._reader = reader
+        return reader
 
-    def _extract_text(self, reader, image_path: str) -> str:
+    def _start_ocr_pool(self, total_files: int):
+        processes = max(1, (os.cpu_count() or 1) // POOL_THREADS_PER_PROCESS)
+        if total_files <= POOL_MIN_FILES or processes < 2:
+            return None
+        self.log_msg.emit(f"Starting {processes} OCR processes...")
         try:
-            results = reader.readtext(image_path)
-            text = " ".join([r[1] for r in results])
-            text = " ".join(text.split())
-            global text_length_limit
-            if text_length_limit is not None:
-                text = text[:text_length_limit]
-            return text.strip() if text.strip() else "[No text found]"
+            # spawn, not fork: forking a process that already holds PyTorch threads can deadlock
+            return multiprocessing.get_context("spawn").Pool(processes, initializer=_init_pool_reader)
         except Exception as e:
-            return f"Error: {e}"
+            self.log_msg.emit(f"OCR processes unavailable, running in-process: {e}")
+            return None
+
+    def _ocr(self, reader, images: list, limit: int | None) -> list:
+        if self._ocr_pool is not None:
+            return self._ocr_pool.apply(_ocr_batch, (images, limit))
+        return extract_batch(reader, images, limit)
+
+    def _open_cache(self, output_folder: str):
+        try:
+            cache = sqlite3.connect(os.path.join(output_folder, CACHE_DB_NAME), check_same_thread=False)
+            cache.execute("CREATE TABLE IF NOT EXISTS ocr_cache (hash TEXT PRIMARY KEY, text TEXT)")
+            return cache
+        except sqlite3.Error as e:
+            self.log_msg.emit(f"OCR cache disabled: {e}")
+            return None
+
+    def _warm_up(self, reader, batch_size: int):
+        # The first forward pass pays for allocator/thread-pool setup; run it on a
+        # blank batch so the first real batch isn't penalized.
+        try:
+            reader.readtext_batched(
+                np.zeros([batch_size, MAX_IMAGE_SIDE, MAX_IMAGE_SIDE, 3], dtype=np.uint8),
+                batch_size=batch_size
+            )
+        except Exception:
+            pass
+
+    def _finish_text(self, text: str) -> str:
+        if text.startswith("Error"):
+            return text
+        if self._text_limit is not None:
+            text = text[:self._text_limit]
+        return text.strip() if text.strip() else "[No text found]"
+
+    def _prefetch(self, batches: list, out: queue.Queue, stop: threading.Event):
+        # Each file is read once: the bytes feed both the cache hash and, on a
+        # cache miss, the decode.
+        try:
+            for batch in batches:
+                if stop.is_set():
+                    break
+                datas = [read_file(p) for _, p in batch]
+                hashes = [hashlib.sha1(data).hexdigest() if data else None for data in datas]
+                out.put((batch, datas, hashes))
+        finally:
+            out.put(None)   # the run loop waits on this sentinel
+
+    def _extract_batch_cached(self, reader, cache, datas: list, hashes: list) -> list:
+
+        # Full texts are keyed by hash alone and serve any limit. Texts cut short
+        # by a limit are keyed "hash:limit" so they never stand in for the full text.
+        limit = self._text_limit or None
+        texts = [None] * len(datas)
+        if cache is not None:
+            with self._cache_lock:
+                for i, h in enumerate(hashes):
+                    if not h:
+                        continue
+                    keys = (h, f"{h}:{limit}") if limit else (h, h)
+                    row = cache.execute("SELECT text FROM ocr_cache WHERE hash IN (?, ?)", keys).fetchone()
+                    if row:
+                        texts[i] = row[0]
+
+        misses = [i for i, t in enumerate(texts) if t is None]
+        if misses:
+            images = [load_and_resize(datas[i]) if datas[i] else None for i in misses]
+            fresh = self._ocr(reader, images, limit)
+            for i, text in zip(misses, fresh):
+                texts[i] = text
+            if cache is not None:
+                with self._cache_lock:
+                    for i in misses:
+                        if hashes[i] and not texts[i].startswith("Error"):
+                            key = f"{hashes[i]}:{limit}" if limit and len(texts[i]) >= limit else hashes[i]
+                            cache.execute("INSERT OR REPLACE INTO ocr_cache VALUES (?, ?)", (key, texts[i]))
+                    cache.commit()
+
+        return [self._finish_text(t) for t in texts]
+
+    def _claim_folder(self, output_folder: str, folder_name: str) -> str:
+        # Images with the same text get name_2, name_3, ... instead of overwriting
+        # each other; each name is created once per job, so no repeat makedirs.
+        # Final names are tracked, not base names: "a_2" may itself be some text.
+        candidate, count = folder_name, 1
+        with self._folder_lock:
+            while candidate.lower() in self._claimed_folders:   # NTFS/APFS names are case-insensitive
+                count += 1
+                candidate = f"{folder_name}_{count}"
+            self._claimed_folders.add(candidate.lower())
+        folder_path_final = os.path.join(output_folder, candidate)
+        os.makedirs(folder_path_final, exist_ok=True)
+        return folder_path_final
+
+    def _process_one(self, file_name: str, extracted_text: str, output_folder: str) -> Row:
+        # --- Create folder for extracted text ---
+        if extracted_text.strip() and not extracted_text.startswith("Error"):
+            folder_name = sanitize_filename(extracted_text[:50].replace(" ", "_")) or "Extracted"
+            folder_path_final = self._claim_folder(output_folder, folder_name)
+
+            text_file_path = os.path.join(folder_path_final, "extracted_text.txt")
+            with open(text_file_path, "w", encoding="utf-8", buffering=64 * 1024) as text_file:
+                text_file.write(extracted_text)
+
+            saved_path = folder_path_final if self._use_full_path else os.path.relpath(folder_path_final, self.folder_path)
+        else:
+            saved_path = "[No folder created]"
+
+        # --- Unified record ---
+        return Row(file_name, extracted_text, saved_path)
+
+    def _process_batch(self, reader, cache, batch: list, datas: list, hashes: list, output_folder: str) -> list:
+        # batch holds (file_name, file_path) pairs
+        for file_name, _ in batch:
+            self.log_msg.emit(f"Processing: {file_name}")
+        batch_texts = self._extract_batch_cached(reader, cache, datas, hashes)
+        return [(file_path, self._process_one(file_name, text, output_folder))
+                for (file_name, file_path), text in zip(batch, batch_texts)]
+
+    def _emit_result(self, file_path: str, record: Row, processed: int, total: int):
+        self.file_preview.emit(load_preview(file_path))
+        self.file_done.emit(file_path, record.extracted_text)
+        self.progress_step.emit(processed, total)
 
     def run(self):
         try:
             if self.specific_files:
-                files = self.specific_files
+                files = [(f, os.path.join(self.folder_path, f)) for f in self.specific_files]
             else:
-                files = [f for f in os.listdir(self.folder_path)
-                         if f.lower().endswith((".png", ".jpg", ".jpeg", ".bmp", ".tiff"))]
+                with os.scandir(self.folder_path) as it:
+                    files = [(e.name, e.path) for e in it
+                             if e.is_file() and os.path.splitext(e.name)[1].lower() in IMAGE_EXTENSIONS]
         except Exception as e:
             self.error_msg.emit(f"Invalid folder: {e}")
             return
@@ -76,56 +545,116 @@ class OCRWorker(QThread):
         output_folder = os.path.join(self.folder_path, "Extracted_Texts")
         os.makedirs(output_folder, exist_ok=True)
 
-        reader = self._get_reader()
+        # Loaded even when OCR runs in child processes: this downloads the weights and
+        # exports the ONNX detector once, before the children go looking for them.
+        # A few spare paths in case some of the first pages can't be decoded
+        reader = self._get_reader([p for _, p in files[:2 * CALIBRATION_PAGES]])
         if reader is None:
             return
+        self._ocr_pool = self._start_ocr_pool(total_files)
 
-        records = []
-        self.start_time = time.time()
-
-        for idx, file_name in enumerate(files):
-            if self.isInterruptionRequested():
-                break
-
-            file_path = os.path.join(self.folder_path, file_name)
-            self.file_preview.emit(file_path)
-            self.log_msg.emit(f"Processing: {file_name}")
-
-            extracted_text = self._extract_text(reader, file_path)
-
-            # --- Create folder for extracted text ---
-            if extracted_text.strip() and not extracted_text.startswith("Error"):
-                folder_name = sanitize_filename(extracted_text[:50].replace(" ", "_")) or "Extracted"
-                folder_path_final = os.path.join(output_folder, folder_name)
-                os.makedirs(folder_path_final, exist_ok=True)
-
-                text_file_path = os.path.join(folder_path_final, "extracted_text.txt")
-                with open(text_file_path, "w", encoding="utf-8") as text_file:
-                    text_file.write(extracted_text)
-
-                saved_path = folder_path_final if use_full_path else os.path.relpath(folder_path_final, self.folder_path)
-            else:
-                saved_path = "[No folder created]"
-
-            # --- Append unified record ---
-            records.append({
-                "File Name": file_name,
-                "Extracted Text": extracted_text,
-                "Saved Path": saved_path
-            })
-
-            self.file_done.emit(file_path, extracted_text)
-            self.progress_step.emit(idx + 1, total_files)
-
-        if records:
+        cache = self._open_cache(output_folder)
+        executor = None
+        stop_prefetch = threading.Event()
+        exhausted = True   # until the prefetch thread is started
+        try:
+            # Rows go straight into the sheet as files finish; nothing else is kept per file
+            if pyexcelerate is None and not LXML:
+                self.log_msg.emit("Warning: lxml is not installed; writing Excel with openpyxl will be slow.")
+            sheet = ResultSheet()
+            processed = 0
+            emit_every = max(1, total_files // 200)
+            last_emit_count, last_emit_ts = 0, 0.0
+            last_result = None
+            batch_size = min(BATCH_SIZE, total_files)
+            # A single batch would only move its cost into the warm-up, and with the
+            # pool running, this reader does no OCR. Later jobs reuse the warmed model.
+            if total_files > batch_size and self._ocr_pool is None and not OCRWorker._warmed_up:
+                self._warm_up(reader, batch_size)
+                OCRWorker._warmed_up = True
+            self.start_time = time.time()
+
+            # OCR inference and image decoding release the GIL, so batches run concurrently
+            # against the shared reader; per-file results are emitted from this thread.
+            # Files are read by a separate thread into a bounded queue, and only as many
+            # batches as there are workers are in flight, so reads stay a step ahead.
+            batches = [files[i:i + batch_size] for i in range(0, total_files, batch_size)]
+            max_workers = min(os.cpu_count() or 1, len(batches))
+            prefetched = queue.Queue(maxsize=PREFETCH_BATCHES)
+            threading.Thread(target=self._prefetch, args=(batches, prefetched, stop_prefetch), daemon=True).start()
+            exhausted = False
+            executor = ThreadPoolExecutor(max_workers=max_workers)
+
+            futures = {}
+            while futures or not exhausted:
+                if self.isInterruptionRequested():
+                    break
+
+                while not exhausted and len(futures) < max_workers:
+                    item = prefetched.get()
+                    if item is None:
+                        exhausted = True
+                        break
+                    batch, datas, hashes = item
+                    futures[executor.submit(self._process_batch, reader, cache, batch, datas, hashes,
+                                            output_folder)] = batch
+                if not futures:
+                    break
+
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    batch = futures.pop(future)
+                    try:
+                        batch_results = future.result()
+                    except Exception as e:
+                        self.log_msg.emit(f"Failed processing {', '.join(name for name, _ in batch)}: {e}")
+                        continue
+
+                    for file_path, record in batch_results:
+                        processed += 1
+                        sheet.append(record)
+                        last_result = (file_path, record)
+
+                        # Repainting for every file backs up the GUI once OCR is fast; only the
+                        # latest preview is visible anyway.
+                        now = time.monotonic()
+                        if (processed == total_files or processed - last_emit_count >= emit_every
+                                or now - last_emit_ts > PROGRESS_INTERVAL):
+                            self._emit_result(*last_result, processed, total_files)
+                            last_emit_count, last_emit_ts = processed, now
+
+            if last_result is not None and last_emit_count != processed:
+                self._emit_result(*last_result, processed, total_files)
+        except Exception as e:
+            self.error_msg.emit(f"Extraction failed: {e}")
+            return
+        finally:
+            # Also runs on cancel and on errors, so no worker, thread or process outlives the job
+            stop_prefetch.set()
+            if executor is not None:
+                executor.shutdown(wait=True, cancel_futures=True)
+            # Unblock the reader thread so it can see the stop flag and exit
+            while not exhausted:
+                exhausted = prefetched.get() is None
+            if self._ocr_pool is not None:
+                self._ocr_pool.terminate()
+                self._ocr_pool.join()
+                self._ocr_pool = None
+            if cache is not None:
+                cache.close()
+
+        excel_file_path = None
+        if processed:
             try:
                 excel_file_path = os.path.join(output_folder, "extracted_texts.xlsx")
-                pd.DataFrame(records).to_excel(excel_file_path, index=False)
+                sheet.save(excel_file_path)
                 self.log_msg.emit(f"Saved results to {excel_file_path}")
             except Exception as e:
+                excel_file_path = None
                 self.error_msg.emit(f"Failed writing Excel: {e}")
 
-        self.all_done.emit(records, output_folder)
+        self.all_done.emit({"processed": processed, "total": total_files,
+                            "excel_file": excel_file_path}, output_folder)
 
 
 # ------------------------- Main App -------------------------
@@ -184,7 +713,7 @@ class OCRApp(QMainWindow):
 
         self.image_label = QLabel("Image preview")
         self.image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.image_label.setMinimumSize(400, 300)
+        self.image_label.setMinimumSize(*PREVIEW_SIZE)
         self.image_label.setStyleSheet("border: 1px solid #ccc;")
 
         preview_row = QHBoxLayout()
@@ -223,6 +752,12 @@ class OCRApp(QMainWindow):
         self.timer = QTimer()
         self.timer.timeout.connect(self.update_clock)
 
+        # --- Worker log lines are batched into one append per tick ---
+        self._log_buffer = []
+        self.log_timer = QTimer()
+        self.log_timer.timeout.connect(self._flush_log)
+        self.log_timer.start(250)
+
     # ---------- Config setters ----------
     def _set_scan_mode(self, mode: str):
         self.scan_mode = mode
@@ -264,10 +799,12 @@ class OCRApp(QMainWindow):
         self.text_preview.clear()
         self.image_label.clear()
         self.log_panel.clear()
+        self._log_buffer.clear()
         self.progress_bar.setValue(0)
         self.progress_label.setText("Progress: 0/0 (0%) | Time Left: --")
 
-        self.worker = OCRWorker(folder_path, self.scan_mode, specific_files)
+        self.worker = OCRWorker(folder_path, self.scan_mode, specific_files,
+                                text_length_limit, use_full_path)
         self._connect_worker_signals()
         self.worker.start()
 
@@ -308,23 +845,21 @@ class OCRApp(QMainWindow):
         self.text_preview.clear()
         self.text_preview.append(text if text else "[No text found]")
 
-    def _on_file_preview(self, file_path: str):
+    def _on_file_preview(self, img: QImage):
         try:
-            img = QImage(file_path)
             if not img.isNull():
-                pix = QPixmap.fromImage(img).scaled(
-                    400, 300, Qt.AspectRatioMode.KeepAspectRatio,
-                    Qt.TransformationMode.SmoothTransformation
-                )
-                self.image_label.setPixmap(pix)
+                self.image_label.setPixmap(QPixmap.fromImage(img))
             else:
                 self.image_label.clear()
         except Exception:
             self.image_label.clear()
 
-    def _on_all_done(self, records: list, output_folder: str):
+    def _on_all_done(self, summary: dict, output_folder: str):
         self.timer.stop()
-        self.log_panel.appendPlainText("Extraction finished.")
+        self._flush_log()
+        self.log_panel.appendPlainText(
+            f"Extraction finished ({summary['processed']}/{summary['total']} files)."
+        )
         QMessageBox.information(
             self, "Success", f"Results saved in:\n{output_folder}"
         )
@@ -340,16 +875,23 @@ class OCRApp(QMainWindow):
 
     def _on_error(self, msg: str):
         self.timer.stop()
+        self._flush_log()
         self.log_panel.appendPlainText(f"ERROR: {msg}")
         QMessageBox.critical(self, "Error", msg)
 
     def _on_log(self, msg: str):
-        self.log_panel.appendPlainText(msg)
+        self._log_buffer.append(msg)
+
+    def _flush_log(self):
+        if self._log_buffer:
+            self.log_panel.appendPlainText("\n".join(self._log_buffer))
+            self._log_buffer.clear()
 
     def cancel_process(self):
         if self.worker and self.worker.isRunning():
             self.worker.requestInterruption()
             self.timer.stop()
+            self._flush_log()
             self.log_panel.appendPlainText("Process cancellation requested.")
 
     def show_about(self):
@@ -367,6 +909,7 @@ class OCRApp(QMainWindow):
 
 # ------------------------- Run -------------------------
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # OCR child processes in frozen Windows builds
     app = QApplication(sys.argv)
     window = OCRApp()
     window.show()
@@ -3,8 +3,45 @@ from tkinter import filedialog, messagebox, ttk
 from PIL import Image, ImageTk
 import easyocr
 import os
-from fpdf import FPDF
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.utils import simpleSplit
+from reportlab.pdfgen import canvas
 import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from ocr_common import IMAGE_EXTENSIONS, blank_summary, extract_text_batch, load_image
+
+# Characters that can't appear in a file name, plus spaces, become underscores
+_FILENAME_CHARS = str.maketrans({c: "_" for c in ' \\/*?:"<>|'})
+
+# Images per readtext_batched call in bulk mode
+BATCH_SIZE = 8
+
+# PDF layout, in points
+PDF_FONT = "Helvetica"
+PDF_FONT_SIZE = 10
+PDF_LEADING = 12
+PDF_MARGIN = 40
+
+# Failed files named in the bulk completion message; the rest are counted
+MAX_FAILED_NAMES = 10
+
+_READER = None
+_READER_LOCK = threading.Lock()  # single-image and bulk threads may both ask for the reader first
+
+def _reader():
+    """
+    Return the shared EasyOCR reader, loading the model on first use.
+
+    Returns:
+        easyocr.Reader: The reader instance.
+    """
+    global _READER
+    if _READER is None:
+        with _READER_LOCK:
+            if _READER is None:
+                _READER = easyocr.Reader(["en"], gpu=False)
+    return _READER
 
 def extract_text_from_image(image_path):
     """
@@ -17,8 +54,7 @@ def extract_text_from_image(image_path):
         str: The extracted text.
     """
     try:
-        reader = easyocr.Reader(["en"], gpu=False)
-        results = reader.readtext(image_path)
+        results = _reader().readtext(image_path)
         text = "\n".join([result[1] for result in results])
         return text
     except Exception as e:
@@ -35,7 +71,7 @@ def save_text_as_filename(image_path, folder_path):
     extracted_text = extract_text_from_image(image_path)
     if extracted_text.strip():
         # Create a valid filename from the extracted text
-        filename = extracted_text.split('\n')[0][:50].replace(" ", "_").replace("/", "_") + ".txt"
+        filename = extracted_text.split('\n')[0][:50].translate(_FILENAME_CHARS) + ".txt"
         save_path = os.path.join(folder_path, filename)
         try:
             with open(save_path, "w", encoding="utf-8") as file:
@@ -56,7 +92,7 @@ def save_text_with_preview(image_path, folder_path):
     """
     extracted_text = extract_text_from_image(image_path)
     if extracted_text.strip():
-        filename = extracted_text.split('\n')[0][:50].replace(" ", "_").replace("/", "_") + ".txt"
+        filename = extracted_text.split('\n')[0][:50].translate(_FILENAME_CHARS) + ".txt"
         save_path = os.path.join(folder_path, filename)
         with open(save_path, "w", encoding="utf-8") as file:
             file.write(extracted_text)
@@ -73,6 +109,72 @@ def process_save_text_as_filename():
         if file_path:
             save_text_with_preview(file_path, folder_path)
 
+def add_pdf_pages(pdf, file_name, extracted_text):
+    """
+    Draw one image's extracted text onto the PDF, wrapping long lines and
+    continuing onto extra pages when needed.
+
+    Args:
+        pdf (canvas.Canvas): The ReportLab canvas being built.
+        file_name (str): Name of the source image, used as the heading.
+        extracted_text (str): The text to write.
+    """
+    width, height = letter
+    lines = []
+    for line in f"{file_name}:\n\n{extracted_text}".split("\n"):
+        lines.extend(simpleSplit(line, PDF_FONT, PDF_FONT_SIZE, width - 2 * PDF_MARGIN) or [""])
+
+    lines_per_page = int((height - 2 * PDF_MARGIN) // PDF_LEADING)
+    for start in range(0, len(lines), lines_per_page):
+        text = pdf.beginText(PDF_MARGIN, height - PDF_MARGIN)
+        text.setFont(PDF_FONT, PDF_FONT_SIZE, leading=PDF_LEADING)
+        text.textLines(lines[start:start + lines_per_page])
+        pdf.drawText(text)
+        pdf.showPage()
+
+def process_image_batch(reader, folder_path, batch):
+    """
+    Extract text from a batch of images and save each as a .txt file next to it.
+
+    Runs on a worker thread; it must not touch Tk widgets or the PDF.
+
+    Args:
+        reader (easyocr.Reader): The shared reader.
+        folder_path (str): The folder the .txt files are written to.
+        batch (list): (file_name, file_path) pairs for the images in this batch.
+
+    Returns:
+        tuple: (file_name, extracted_text) pairs in batch order, and how many
+        images were skipped as blank.
+    """
+    batch_texts, blanks = extract_text_batch(lambda: reader, [load_image(file_path) for _, file_path in batch])
+
+    batch_names = [file_name for file_name, _ in batch]
+    for file_name, extracted_text in zip(batch_names, batch_texts):
+        # Save text as .txt file
+        text_file_path = os.path.join(folder_path, f"{os.path.splitext(file_name)[0]}.txt")
+        with open(text_file_path, "w", encoding="utf-8") as text_file:
+            text_file.write(extracted_text)
+
+    return list(zip(batch_names, batch_texts)), blanks
+
+def failed_summary(failed_files):
+    """
+    Describe the files a bulk job could not process, for its completion message.
+
+    Args:
+        failed_files (list): Names of the files whose batch raised an error.
+
+    Returns:
+        str: A sentence to append to the message, or "" if nothing failed.
+    """
+    if not failed_files:
+        return ""
+    names = ", ".join(failed_files[:MAX_FAILED_NAMES])
+    if len(failed_files) > MAX_FAILED_NAMES:
+        names += f" and {len(failed_files) - MAX_FAILED_NAMES} more"
+    return f"\n\n{len(failed_files)} file(s) could not be processed: {names}"
+
 def process_bulk_images(folder_path, save_as_pdf=False):
     """
     Process all images in the selected folder, extract text, and save to files.
@@ -85,41 +187,65 @@ def process_bulk_images(folder_path, save_as_pdf=False):
         messagebox.showerror("Error", "Selected folder is invalid.")
         return
 
-    files = [f for f in os.listdir(folder_path) if f.lower().endswith((".png", ".jpg", ".jpeg", ".bmp", ".tiff"))]
+    with os.scandir(folder_path) as it:
+        files = [(e.name, e.path) for e in it
+                 if e.is_file() and os.path.splitext(e.name)[1].lower() in IMAGE_EXTENSIONS]
     total_files = len(files)
     if total_files == 0:
         messagebox.showinfo("No Images Found", "No valid image files found in the selected folder.")
         return
 
-    progress_bar["maximum"] = total_files
-
-    pdf = FPDF()
-    pdf.set_auto_page_break(auto=True, margin=15)
-
-    for i, file_name in enumerate(files):
-        file_path = os.path.join(folder_path, file_name)
-        extracted_text = extract_text_from_image(file_path)
-
-        # Save text as .txt file
-        text_file_path = os.path.join(folder_path, f"{os.path.splitext(file_name)[0]}.txt")
-        with open(text_file_path, "w", encoding="utf-8") as text_file:
-            text_file.write(extracted_text)
-
-        if save_as_pdf:
-            pdf.add_page()
-            pdf.set_font("Arial", size=12)
-            pdf.multi_cell(0, 10, f"{file_name}:\n\n{extracted_text}")
+    try:
+        reader = _reader()
+    except Exception as e:
+        messagebox.showerror("Error", f"Failed to load OCR model: {str(e)}")
+        return
 
-        # Update progress bar
-        progress_bar["value"] = i + 1
-        root.update_idletasks()
+    progress_bar["maximum"] = total_files
 
+    pdf_file_path = os.path.join(folder_path, "extracted_texts.pdf")
+    pdf = canvas.Canvas(pdf_file_path, pagesize=letter) if save_as_pdf else None
+
+    # OCR and .txt writes run on the pool (Torch releases the GIL); the PDF canvas
+    # is not thread-safe, so pages are added here, in file order, as batches complete.
+    batches = [files[start:start + BATCH_SIZE] for start in range(0, total_files, BATCH_SIZE)]
+    processed = 0
+    blank_files = 0
+    failed_files = []
+    next_batch = 0
+    completed = {}
+    with ThreadPoolExecutor(max_workers=min(os.cpu_count() or 1, len(batches))) as executor:
+        futures = {executor.submit(process_image_batch, reader, folder_path, batch): index
+                   for index, batch in enumerate(batches)}
+        for future in as_completed(futures):
+            index = futures[future]
+            try:
+                results, blanks = future.result()
+            except Exception:
+                # e.g. a .txt file that can't be written; the other batches still
+                # finish and the PDF is still saved
+                failed_files.extend(file_name for file_name, _ in batches[index])
+                results, blanks = [], 0
+            completed[index] = results
+            blank_files += blanks
+
+            # Update progress bar
+            processed += len(batches[index])
+            progress_bar["value"] = processed
+            root.update_idletasks()
+
+            while next_batch in completed:
+                for file_name, extracted_text in completed.pop(next_batch):
+                    if save_as_pdf:
+                        add_pdf_pages(pdf, file_name, extracted_text)
+                next_batch += 1
+
+    summary = blank_summary(blank_files) + failed_summary(failed_files)
     if save_as_pdf:
-        pdf_file_path = os.path.join(folder_path, "extracted_texts.pdf")
-        pdf.output(pdf_file_path)
-        messagebox.showinfo("Success", f"Texts saved as PDF at {pdf_file_path}")
+        pdf.save()
+        messagebox.showinfo("Success", f"Texts saved as PDF at {pdf_file_path}" + summary)
     else:
-        messagebox.showinfo("Success", "Texts extracted and saved as .txt files.")
+        messagebox.showinfo("Success", "Texts extracted and saved as .txt files." + summary)
 
 def open_file_or_folder():
     path = filedialog.askdirectory(title="Select Folder")
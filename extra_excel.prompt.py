@@ -1,38 +1,354 @@
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 from PIL import Image, ImageTk
-import easyocr
 import os
+
+# Also sets the BLAS thread defaults, so it must come before anything that imports torch
+from ocr_common import (BATCH_CANVAS, IMAGE_EXTENSIONS, PHYSICAL_CORES, ExternalDetector, blank_summary,
+                        decode_chunks, export_detector_onnx, extract_text_batch, load_image,
+                        make_thumbnail, read_text, show_canceled)
+
+import contextlib
+import importlib.metadata
+import importlib.util
+import multiprocessing
+import cv2
+import numpy as np
+import platform
+import queue
 import threading
-import pandas as pd
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import repeat
+
+# torch and easyocr take seconds to import, so they are loaded with the first
+# reader (see load_ocr_modules) rather than before the window appears
+torch = None
+easyocr = None
+
+# Optional: PaddleOCR for normal mode. Only its version is read here; paddle
+# itself is imported with the first reader. PaddleReader speaks the 2.x API
+# (3.x changed ocr()'s arguments and result layout), else EasyOCR is used.
+try:
+    _PADDLE_2X = int(importlib.metadata.version("paddleocr").split(".")[0]) < 3
+except importlib.metadata.PackageNotFoundError:
+    _PADDLE_2X = False
+
+try:
+    from filelock import FileLock
+except ImportError:  # optional: without it, simultaneous first runs may race on the download
+    FileLock = None
 
 # Global variable for stopping the process
 stop_process = False
 
+# Images per readtext_batched call in bulk mode
+BATCH_SIZE = 16
+
+# Decoded chunks waiting for OCR; each holds up to BATCH_SIZE full-size images
+PREFETCH_CHUNKS = 2
+
+# Excel sheet columns for each save option
+EXCEL_HEADERS = {
+    "single_file": ("File Name", "Extracted Text"),
+    "separate_files": ("File Name", "Saved Path"),
+    "extracted_name": ("Extracted Name", "Saved Path"),
+}
+
+# Raw-fd flags for writing whole text files; O_BINARY stops Windows from translating
+# newlines again, since the data already uses os.linesep
+WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+# Normal-mode bulk jobs of at least POOL_MIN_CHUNKS chunks are spread over
+# processes, each with its own reader and a small thread budget, since EasyOCR's
+# Python-side pre/post-processing holds the GIL
+POOL_MIN_CHUNKS = 4
+POOL_THREADS_PER_PROCESS = 2
+
+# Minimum time between progress/preview redraws (s), so fast OCR can't flood Tk
+PREVIEW_INTERVAL = 0.25
+
+class OpenVinoDetector(ExternalDetector):
+    """
+    OpenVINO stand-in for EasyOCR's CRAFT text detector.
+    """
+
+    def __init__(self, model_path):
+        import openvino as ov
+        self.model = ov.Core().compile_model(model_path, "CPU")
+
+    def run(self, x):
+        result = self.model(x)
+        return result[0], result[1]
+
+def use_openvino_detector(reader):
+    """
+    Run a CPU reader's detector through OpenVINO, exporting it to ONNX once.
+
+    Args:
+        reader (easyocr.Reader): The reader to patch.
+
+    Returns:
+        bool: True if the OpenVINO detector is in use, False if the PyTorch one is kept.
+    """
+    # Optional: without OpenVINO (or off x86) normal mode keeps the PyTorch detector
+    if platform.machine().lower() not in ("x86_64", "amd64") or importlib.util.find_spec("openvino") is None:
+        return False
+    onnx_path = os.path.join(reader.model_storage_directory, "craft_fp32.onnx")
+    try:
+        if not os.path.exists(onnx_path):
+            export_detector_onnx(reader.detector, onnx_path)
+        reader.detector = OpenVinoDetector(onnx_path)
+        return True
+    except Exception:
+        return False
+
+class AutocastRecognizer:
+    """
+    Runs EasyOCR's recognizer under CUDA autocast (bf16, or fp16 before Ampere).
+
+    Only the recognizer is wrapped: EasyOCR hands the detector's score maps to
+    numpy and OpenCV, which reject half-precision arrays. The output is cast
+    back to float32 for the same reason.
+    """
+
+    def __init__(self, module):
+        self.module = module
+        self.dtype = torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+
+    def __call__(self, *args, **kwargs):
+        with torch.autocast("cuda", dtype=self.dtype):
+            return self.module(*args, **kwargs).float()
+
+    def __getattr__(self, name):
+        return getattr(self.module, name)
+
+class PaddleReader:
+    """
+    Wraps PaddleOCR (oneDNN CPU kernels) in the part of the easyocr.Reader API used here.
+
+    readtext and readtext_batched take file paths or RGB arrays and return
+    (box, text, confidence) tuples, as EasyOCR does.
+    """
+
+    def __init__(self):
+        from paddleocr import PaddleOCR
+        self.ocr = PaddleOCR(use_angle_cls=False, lang="en", enable_mkldnn=True,
+                             cpu_threads=int(os.environ["OMP_NUM_THREADS"]))
+
+    def readtext(self, image):
+        if isinstance(image, np.ndarray):
+            image = cv2.cvtColor(image, cv2.COLOR_RGB2BGR)  # PaddleOCR expects OpenCV order
+        lines = self.ocr.ocr(image, cls=False)[0] or []
+        return [(box, text, confidence) for box, (text, confidence) in lines]
+
+    def readtext_batched(self, images, **kwargs):
+        return [self.readtext(image) for image in images]
+
+def warm_up(reader):
+    """
+    Run one blank batch so cuDNN autotuning happens before the first real chunk.
+
+    Args:
+        reader (easyocr.Reader): A reader on the GPU.
+    """
+    blank = np.zeros((BATCH_CANVAS, BATCH_CANVAS, 3), dtype=np.uint8)
+    reader.readtext_batched([blank] * BATCH_SIZE, batch_size=BATCH_SIZE)
+
+# EasyOCR weights shared by all scan modes and runs, instead of a download per mode
+MODEL_DIR = os.path.join(os.path.expanduser("~"), ".cache", "easyocr_ins")
+MODEL_FILES = ("craft_mlt_25k.pth", "english_g2.pth")
+
+_OCR_MODULES_LOCK = threading.Lock()
+
+def load_ocr_modules():
+    """
+    Import torch and easyocr on first use and apply the thread and kernel settings.
+
+    The settings are applied once per process, even if importing easyocr fails
+    and is retried: torch refuses a second set_num_interop_threads call.
+    """
+    global torch, easyocr
+    with _OCR_MODULES_LOCK:
+        if torch is None:
+            import torch as _torch
+            _torch.set_num_threads(int(os.environ["OMP_NUM_THREADS"]))
+            _torch.set_num_interop_threads(1)
+            # GPU modes: let cuDNN pick the fastest kernels for the fixed batch canvas,
+            # and allow TF32 matmuls on Ampere and newer
+            _torch.backends.cudnn.benchmark = True
+            _torch.backends.cuda.matmul.allow_tf32 = True
+            torch = _torch
+        if easyocr is None:
+            import easyocr as _easyocr
+            easyocr = _easyocr
+
+# Loaded readers, keyed by scan mode; loading the model dominates per-image cost
+_READER_CACHE = {}
+_READER_LOCK = threading.Lock()  # the Tk and bulk threads may both ask for a reader first
+
+def get_reader(scan_mode):
+    """
+    Return the EasyOCR reader for a scan mode, loading it on first use.
+
+    Args:
+        scan_mode (str): Scan mode - normal, super_scan, or intense_scan.
+
+    Returns:
+        easyocr.Reader: The reader instance.
+    """
+    key = (scan_mode,)
+    reader = _READER_CACHE.get(key)
+    if reader is not None:
+        return reader
+    with _READER_LOCK:
+        reader = _READER_CACHE.get(key)
+        if reader is None and _PADDLE_2X and scan_mode not in ("super_scan", "intense_scan"):
+            try:
+                reader = _READER_CACHE[key] = PaddleReader()
+            except Exception:
+                reader = None  # fall back to EasyOCR
+        if reader is None:
+            load_ocr_modules()
+            model_dir = MODEL_DIR
+            if scan_mode == "intense_scan" and os.path.isdir("high_precision_model"):
+                model_dir = "high_precision_model"  # weights supplied by the user
+            os.makedirs(model_dir, exist_ok=True)
+
+            # The lock keeps another instance from reading half-downloaded weights
+            with FileLock(os.path.join(model_dir, ".lock")) if FileLock else contextlib.nullcontext():
+                download = not all(os.path.exists(os.path.join(model_dir, f)) for f in MODEL_FILES)
+                if scan_mode in ("super_scan", "intense_scan"):
+                    reader = easyocr.Reader(["en"], gpu=True, model_storage_directory=model_dir,
+                                            download_enabled=download, cudnn_benchmark=True)
+                else:
+                    reader = easyocr.Reader(["en"], gpu=False, model_storage_directory=model_dir,
+                                            download_enabled=download, quantize=True)
+                    use_openvino_detector(reader)
+            # gpu=True quietly falls back to the CPU when CUDA is unavailable
+            if reader.device == "cuda":
+                reader.recognizer = AutocastRecognizer(reader.recognizer)
+                warm_up(reader)
+            _READER_CACHE[key] = reader
+    return reader
+
 def extract_text_from_image(image_path, scan_mode):
     """
     Extract text from an image file using EasyOCR.
 
     Args:
-        image_path (str): The file path to the image.
+        image_path (str or numpy.ndarray): The file path to the image, or the decoded RGB image.
         scan_mode (str): Scan mode - normal, super_scan, or intense_scan.
 
     Returns:
         str: The extracted text.
     """
+    return read_text(partial(get_reader, scan_mode), image_path)
+
+def ocr_decoded_chunks(decoded, scan_mode):
+    """
+    OCR the chunks queued by decode_chunks, in order.
+
+    Args:
+        decoded (queue.Queue): The decode_chunks queue.
+        scan_mode (str): Scan mode - normal, super_scan, or intense_scan.
+
+    Yields:
+        tuple: (images, texts, blanks) for each chunk; see extract_text_batch.
+    """
+    for _, images in iter(decoded.get, None):
+        if stop_process:
+            continue  # keep draining so decode_chunks sees the flag and finishes
+        yield (images,) + extract_text_batch(partial(get_reader, scan_mode), images)
+
+def ocr_process_count(scan_mode, chunk_count):
+    """
+    Return how many OCR processes a bulk job should use.
+
+    Args:
+        scan_mode (str): Scan mode - normal, super_scan, or intense_scan.
+        chunk_count (int): Number of chunks in the job.
+
+    Returns:
+        int: The process count, or 0 to run OCR in this process.
+    """
+    if scan_mode in ("super_scan", "intense_scan") or chunk_count < POOL_MIN_CHUNKS:
+        return 0
+    workers = (PHYSICAL_CORES or os.cpu_count() or 1) // POOL_THREADS_PER_PROCESS
+    return workers if workers >= 2 else 0
+
+def init_ocr_process(scan_mode):
+    """
+    Set up an OCR worker process: a small thread budget and a reader of its own.
+
+    Args:
+        scan_mode (str): Scan mode - normal, super_scan, or intense_scan.
+    """
+    # Read by PaddleOCR, or by torch when it is imported for an EasyOCR reader
+    os.environ["OMP_NUM_THREADS"] = str(POOL_THREADS_PER_PROCESS)
     try:
-        if scan_mode == "normal":
-            reader = easyocr.Reader(["en"], gpu=False)
-        elif scan_mode == "super_scan":
-            reader = easyocr.Reader(["en"], gpu=True)
-        elif scan_mode == "intense_scan":
-            reader = easyocr.Reader(["en"], gpu=True, model_storage_directory="high_precision_model")
-
-        results = reader.readtext(image_path)
-        text = "\n".join([result[1] for result in results])
-        return text
-    except Exception as e:
-        return f"Error: {str(e)}"
+        get_reader(scan_mode)
+    except Exception:
+        pass  # raising would break the pool; OCR calls then report the error per image
+
+def ocr_chunk(chunk_paths, scan_mode):
+    """
+    Decode and OCR one chunk of images in a worker process.
+
+    Args:
+        chunk_paths (list): The file paths to the images.
+        scan_mode (str): Scan mode - normal, super_scan, or intense_scan.
+
+    Returns:
+        tuple: (texts, blanks); see extract_text_batch.
+    """
+    return extract_text_batch(partial(get_reader, scan_mode), [load_image(p) for p in chunk_paths])
+
+def show_progress(done, total_files, thumbnail, extracted_text):
+    """
+    Update the progress bar and preview boxes; runs on the Tk thread via root.after.
+
+    Args:
+        done (int): Number of images processed so far.
+        total_files (int): Total number of images.
+        thumbnail (PIL.Image.Image): Preview of the last processed image, or None.
+        extracted_text (str): Text of the last processed image.
+    """
+    progress_bar["value"] = done
+    percentage = (done / total_files) * 100
+    progress_label.config(text=f"Progress: {done}/{total_files} ({percentage:.2f}%)")
+
+    if thumbnail is not None:
+        img_tk = ImageTk.PhotoImage(thumbnail)
+        image_preview.config(image=img_tk)
+        image_preview.image = img_tk
+
+    extracted_text_preview.delete(1.0, tk.END)
+    extracted_text_preview.insert(tk.END, extracted_text)
+
+def write_text_files(pending, failed):
+    """
+    Write queued text files until None is received; runs on its own thread.
+
+    Args:
+        pending (queue.Queue): (path, data) pairs, data being the encoded file contents.
+        failed (list): Receives the paths that could not be written.
+    """
+    for path, data in iter(pending.get, None):
+        try:
+            fd = os.open(path, WRITE_FLAGS, 0o644)
+            try:
+                view = memoryview(data)
+                while view:
+                    view = view[os.write(fd, view):]
+            finally:
+                os.close(fd)
+        except OSError:
+            failed.append(path)
+
+def encode_text(text):
+    return text.replace("\n", os.linesep).encode("utf-8")
 
 def process_bulk_images(folder_path, save_option, scan_mode):
     """
@@ -49,7 +365,10 @@ def process_bulk_images(folder_path, save_option, scan_mode):
         messagebox.showerror("Error", "Selected folder is invalid.")
         return
 
-    files = [f for f in os.listdir(folder_path) if f.lower().endswith((".png", ".jpg", ".jpeg", ".bmp", ".tiff"))]
+    # scandir entries carry the file type, so is_file() needs no extra stat call
+    with os.scandir(folder_path) as it:
+        files = [(e.name, e.path) for e in it
+                 if e.is_file() and os.path.splitext(e.name)[1].lower() in IMAGE_EXTENSIONS]
     total_files = len(files)
     if total_files == 0:
         messagebox.showinfo("No Images Found", "No valid image files found in the selected folder.")
@@ -58,63 +377,130 @@ def process_bulk_images(folder_path, save_option, scan_mode):
     progress_bar["maximum"] = total_files
     progress_label.config(text=f"Progress: 0/{total_files} (0%)")
 
+    # Load the model before the loop so a failure is reported once, not per image
+    try:
+        get_reader(scan_mode)
+    except Exception as e:
+        messagebox.showerror("Error", f"Failed to load OCR model: {str(e)}")
+        return
+
     output_folder = os.path.join(folder_path, "Extracted_Texts")
     os.makedirs(output_folder, exist_ok=True)
 
-    records = []  # For storing data for the Excel sheet
-
-    for i, file_name in enumerate(files):
-        if stop_process:
-            messagebox.showinfo("Process Stopped", "The extraction process was canceled.")
-            progress_bar["value"] = 0
-            progress_label.config(text="Progress: Canceled")
-            return
-
-        file_path = os.path.join(folder_path, file_name)
-        extracted_text = extract_text_from_image(file_path, scan_mode)
-
-        # Save based on the selected option
-        if save_option == "single_file":
-            records.append({"File Name": file_name, "Extracted Text": extracted_text})
-        elif save_option == "separate_files":
-            subfolder = os.path.join(output_folder, os.path.splitext(file_name)[0])
-            os.makedirs(subfolder, exist_ok=True)
-            text_file_path = os.path.join(subfolder, "extracted_text.txt")
-            with open(text_file_path, "w", encoding="utf-8") as text_file:
-                text_file.write(extracted_text)
-            records.append({"File Name": file_name, "Saved Path": text_file_path})
-        elif save_option == "extracted_name":
-            if extracted_text.strip():
-                folder_name = extracted_text.split('\n')[0][:50].replace(" ", "_").replace("/", "_")
-                folder_path = os.path.join(output_folder, folder_name)
-                os.makedirs(folder_path, exist_ok=True)
-                text_file_path = os.path.join(folder_path, "extracted_text.txt")
-                with open(text_file_path, "w", encoding="utf-8") as text_file:
-                    text_file.write(extracted_text)
-                records.append({"Extracted Name": folder_name, "Saved Path": text_file_path})
-
-        # Update progress bar and preview boxes
-        progress_bar["value"] = i + 1
-        percentage = ((i + 1) / total_files) * 100
-        progress_label.config(text=f"Progress: {i + 1}/{total_files} ({percentage:.2f}%)")
-
-        img = Image.open(file_path)
-        img.thumbnail((250, 250))
-        img_tk = ImageTk.PhotoImage(img)
-        image_preview.config(image=img_tk)
-        image_preview.image = img_tk
-
-        extracted_text_preview.delete(1.0, tk.END)
-        extracted_text_preview.insert(tk.END, extracted_text)
+    # Excel sheet data, one list per column (see EXCEL_HEADERS)
+    name_column, value_column = [], []
+    created_dirs = set()  # Output folders made so far, to skip repeat makedirs calls
+
+    # Text files go to a background writer so OCR never waits on file creation
+    pending_writes = queue.Queue()
+    failed_writes = []
+    writer = threading.Thread(target=write_text_files, args=(pending_writes, failed_writes), daemon=True)
+    writer.start()
+
+    # Large normal-mode jobs decode and OCR whole chunks in worker processes.
+    # Otherwise images are decoded on a thread pool while this thread runs OCR on
+    # the previous chunk. Widgets are only touched from the Tk thread, through root.after.
+    chunk_files = [files[start:start + BATCH_SIZE] for start in range(0, total_files, BATCH_SIZE)]
+    chunks = [[file_path for _, file_path in chunk] for chunk in chunk_files]
+    workers = ocr_process_count(scan_mode, len(chunks))
+    pool = None
+    if workers:
+        pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"),
+                                   initializer=init_ocr_process, initargs=(scan_mode,))
+        results = ((None,) + result for result in pool.map(ocr_chunk, chunks, repeat(scan_mode)))
+    else:
+        decoded = queue.Queue(maxsize=PREFETCH_CHUNKS)
+        threading.Thread(target=decode_chunks, args=(chunks, decoded, lambda: stop_process), daemon=True).start()
+        results = ocr_decoded_chunks(decoded, scan_mode)
+
+    done = 0
+    blank_files = 0
+    last_preview_ts = 0.0
+    error = None
+    try:
+        for chunk, (images, chunk_texts, blanks) in zip(chunk_files, results):
+            if stop_process:
+                break
+            blank_files += blanks
+
+            for (file_name, _), extracted_text in zip(chunk, chunk_texts):
+                # Save based on the selected option
+                if save_option == "single_file":
+                    name_column.append(file_name)
+                    value_column.append(extracted_text)
+                elif save_option == "separate_files":
+                    subfolder = os.path.join(output_folder, os.path.splitext(file_name)[0])
+                    if subfolder not in created_dirs:
+                        os.makedirs(subfolder, exist_ok=True)
+                        created_dirs.add(subfolder)
+                    text_file_path = os.path.join(subfolder, "extracted_text.txt")
+                    pending_writes.put((text_file_path, encode_text(extracted_text)))
+                    name_column.append(file_name)
+                    value_column.append(text_file_path)
+                elif save_option == "extracted_name":
+                    if extracted_text.strip():
+                        folder_name = extracted_text.split('\n')[0][:50].replace(" ", "_").replace("/", "_")
+                        extracted_folder = os.path.join(output_folder, folder_name)
+                        if extracted_folder not in created_dirs:
+                            os.makedirs(extracted_folder, exist_ok=True)
+                            created_dirs.add(extracted_folder)
+                        text_file_path = os.path.join(extracted_folder, "extracted_text.txt")
+                        pending_writes.put((text_file_path, encode_text(extracted_text)))
+                        name_column.append(folder_name)
+                        value_column.append(text_file_path)
+
+            # Update progress bar and preview boxes with the chunk's last image; the
+            # thumbnail is made here so the Tk thread only wraps it in a PhotoImage
+            done += len(chunk)
+            now = time.monotonic()
+            if done == total_files or now - last_preview_ts > PREVIEW_INTERVAL:
+                last_preview_ts = now
+                # Worker processes keep their arrays, so the preview image is decoded here
+                image = images[-1] if images is not None else load_image(chunk[-1][1])
+                thumbnail = make_thumbnail(image) if image is not None else None
+                root.after(0, show_progress, done, total_files, thumbnail, extracted_text)
+    except Exception as e:
+        # A worker died or a chunk failed; stop the rest of the job
+        error = e
+        stop_process = True
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=stop_process)
+        elif stop_process:
+            for _ in results:
+                pass  # drains the decode queue without running OCR
+        pending_writes.put(None)
+        writer.join()
+    if error is not None:
+        root.after(0, show_canceled, progress_bar, progress_label)
+        messagebox.showerror("Error", f"Bulk extraction failed: {str(error)}")
+        return
+    if stop_process:
+        root.after(0, show_canceled, progress_bar, progress_label)
+        messagebox.showinfo("Process Stopped", "The extraction process was canceled.")
+        return
+    if done < total_files:
+        # The decoder stopped before the last chunk; don't report a partial run as a success
+        messagebox.showerror("Error", "Image decoding stopped before all files were processed.")
+        return
 
-        root.update_idletasks()
+    if failed_writes:
+        messagebox.showwarning("Write Errors", f"{len(failed_writes)} text file(s) could not be saved.")
 
-    # Save records to an Excel file
+    # Save the columns to an Excel file; write-only mode streams the rows out
+    # instead of building a styled cell object for every value
+    import openpyxl
     excel_file_path = os.path.join(output_folder, "extracted_texts.xlsx")
-    df = pd.DataFrame(records)
-    df.to_excel(excel_file_path, index=False)
-
-    messagebox.showinfo("Success", f"All texts have been extracted and saved in {output_folder}")
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet("Extracted")
+    ws.freeze_panes = "A2"
+    ws.append(EXCEL_HEADERS[save_option])
+    for row in zip(name_column, value_column):
+        ws.append(row)
+    wb.save(excel_file_path)
+
+    messagebox.showinfo("Success", f"All texts have been extracted and saved in {output_folder}"
+                        + blank_summary(blank_files))
     os.startfile(output_folder)  # Open the output folder
 
 def start_bulk_processing():
@@ -139,7 +525,9 @@ def open_single_file():
         extracted_text_preview.insert(tk.END, text)
 
         img = Image.open(file_path)
-        img.thumbnail((250, 250))
+        # JPEGs are decoded straight at 1/2-1/8 scale instead of full size
+        img.draft("RGB", (256, 256))
+        img.thumbnail((250, 250), Image.Resampling.LANCZOS)
         img_tk = ImageTk.PhotoImage(img)
         image_preview.config(image=img_tk)
         image_preview.image = img_tk
@@ -152,71 +540,75 @@ def copy_to_clipboard():
         root.update()
         messagebox.showinfo("Success", "Text copied to clipboard!")
 
-# Initialize the GUI
-root = tk.Tk()
-root.title("Enhanced Bulk Image to Text Extractor with Scan Modes")
-root.geometry("900x700")
+# The GUI only starts in the main process; spawned OCR processes import this file too
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+
+    # Initialize the GUI
+    root = tk.Tk()
+    root.title("Enhanced Bulk Image to Text Extractor with Scan Modes")
+    root.geometry("900x700")
 
-# Scan mode selector
-scan_mode_var = tk.StringVar(value="normal")
-scan_frame = tk.Frame(root)
-scan_frame.pack(pady=10)
+    # Scan mode selector
+    scan_mode_var = tk.StringVar(value="normal")
+    scan_frame = tk.Frame(root)
+    scan_frame.pack(pady=10)
 
-normal_scan_radio = tk.Radiobutton(scan_frame, text="Normal Scan", variable=scan_mode_var, value="normal")
-normal_scan_radio.grid(row=0, column=0, padx=10)
+    normal_scan_radio = tk.Radiobutton(scan_frame, text="Normal Scan", variable=scan_mode_var, value="normal")
+    normal_scan_radio.grid(row=0, column=0, padx=10)
 
-super_scan_radio = tk.Radiobutton(scan_frame, text="Super Scan", variable=scan_mode_var, value="super_scan")
-super_scan_radio.grid(row=0, column=1, padx=10)
+    super_scan_radio = tk.Radiobutton(scan_frame, text="Super Scan", variable=scan_mode_var, value="super_scan")
+    super_scan_radio.grid(row=0, column=1, padx=10)
 
-intense_scan_radio = tk.Radiobutton(scan_frame, text="Intense Scan", variable=scan_mode_var, value="intense_scan")
-intense_scan_radio.grid(row=0, column=2, padx=10)
+    intense_scan_radio = tk.Radiobutton(scan_frame, text="Intense Scan", variable=scan_mode_var, value="intense_scan")
+    intense_scan_radio.grid(row=0, column=2, padx=10)
 
-# Save option selector
-save_option_var = tk.StringVar(value="single_file")
-options_frame = tk.Frame(root)
-options_frame.pack(pady=10)
+    # Save option selector
+    save_option_var = tk.StringVar(value="single_file")
+    options_frame = tk.Frame(root)
+    options_frame.pack(pady=10)
 
-single_file_radio = tk.Radiobutton(options_frame, text="Save All in Single Excel Sheet", variable=save_option_var, value="single_file")
-single_file_radio.grid(row=0, column=0, padx=10)
+    single_file_radio = tk.Radiobutton(options_frame, text="Save All in Single Excel Sheet", variable=save_option_var, value="single_file")
+    single_file_radio.grid(row=0, column=0, padx=10)
 
-separate_files_radio = tk.Radiobutton(options_frame, text="Save Each in Separate Files", variable=save_option_var, value="separate_files")
-separate_files_radio.grid(row=0, column=1, padx=10)
+    separate_files_radio = tk.Radiobutton(options_frame, text="Save Each in Separate Files", variable=save_option_var, value="separate_files")
+    separate_files_radio.grid(row=0, column=1, padx=10)
 
-extracted_name_radio = tk.Radiobutton(options_frame, text="Save as Extracted Names in Excel", variable=save_option_var, value="extracted_name")
-extracted_name_radio.grid(row=0, column=2, padx=10)
+    extracted_name_radio = tk.Radiobutton(options_frame, text="Save as Extracted Names in Excel", variable=save_option_var, value="extracted_name")
+    extracted_name_radio.grid(row=0, column=2, padx=10)
 
-# Buttons for single file and bulk processing
-single_file_button = tk.Button(root, text="Extract Single Image", command=open_single_file, font=("Arial", 12), bg="#4CAF50", fg="white")
-single_file_button.pack(pady=10)
+    # Buttons for single file and bulk processing
+    single_file_button = tk.Button(root, text="Extract Single Image", command=open_single_file, font=("Arial", 12), bg="#4CAF50", fg="white")
+    single_file_button.pack(pady=10)
 
-bulk_folder_button = tk.Button(root, text="Extract Bulk Images", command=start_bulk_processing, font=("Arial", 12), bg="#FF5722", fg="white")
-bulk_folder_button.pack(pady=10)
+    bulk_folder_button = tk.Button(root, text="Extract Bulk Images", command=start_bulk_processing, font=("Arial", 12), bg="#FF5722", fg="white")
+    bulk_folder_button.pack(pady=10)
 
-cancel_button = tk.Button(root, text="Cancel Process", command=cancel_process, font=("Arial", 12), bg="#F44336", fg="white")
-cancel_button.pack(pady=10)
+    cancel_button = tk.Button(root, text="Cancel Process", command=cancel_process, font=("Arial", 12), bg="#F44336", fg="white")
+    cancel_button.pack(pady=10)
 
-# Progress bar and label
-progress_bar = ttk.Progressbar(root, orient="horizontal", length=800, mode="determinate")
-progress_bar.pack(pady=10)
+    # Progress bar and label
+    progress_bar = ttk.Progressbar(root, orient="horizontal", length=800, mode="determinate")
+    progress_bar.pack(pady=10)
 
-progress_label = tk.Label(root, text="Progress: 0/0 (0%)", font=("Arial", 10))
-progress_label.pack(pady=5)
+    progress_label = tk.Label(root, text="Progress: 0/0 (0%)", font=("Arial", 10))
+    progress_label.pack(pady=5)
 
-# Preview frames
-preview_frame = tk.Frame(root)
-preview_frame.pack(pady=10, fill="both", expand=True)
+    # Preview frames
+    preview_frame = tk.Frame(root)
+    preview_frame.pack(pady=10, fill="both", expand=True)
 
-# Left: Extracted text preview
-extracted_text_preview = tk.Text(preview_frame, wrap=tk.WORD, height=20, width=40)
-extracted_text_preview.grid(row=0, column=0, padx=10, sticky="nsew")
+    # Left: Extracted text preview
+    extracted_text_preview = tk.Text(preview_frame, wrap=tk.WORD, height=20, width=40)
+    extracted_text_preview.grid(row=0, column=0, padx=10, sticky="nsew")
 
-# Right: Image preview
-image_preview = tk.Label(preview_frame)
-image_preview.grid(row=0, column=1, padx=10, sticky="nsew")
+    # Right: Image preview
+    image_preview = tk.Label(preview_frame)
+    image_preview.grid(row=0, column=1, padx=10, sticky="nsew")
 
-# Configure grid weights for resizing
-preview_frame.columnconfigure(0, weight=1)
-preview_frame.columnconfigure(1, weight=1)
+    # Configure grid weights for resizing
+    preview_frame.columnconfigure(0, weight=1)
+    preview_frame.columnconfigure(1, weight=1)
 
-# Start the GUI loop
-root.mainloop()
\ No newline at end of file
+    # Start the GUI loop
+    root.mainloop()
\ No newline at end of file
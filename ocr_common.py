@@ -0,0 +1,312 @@
+"""
+Helpers shared by the extractor scripts: image decoding, bulk batching,
+previews, and the stand-in text detectors.
+
+Importing this module sets the OMP_NUM_THREADS/MKL_NUM_THREADS defaults, which
+only affect torch and numpy if they are imported afterwards.
+"""
+import os
+
+try:
+    import psutil
+    PHYSICAL_CORES = psutil.cpu_count(logical=False)
+except ImportError:
+    PHYSICAL_CORES = None
+# BLAS pools read these when torch is imported; running one thread per physical
+# core avoids oversubscribing SMT siblings with the decode and Tk threads
+os.environ.setdefault("OMP_NUM_THREADS", str(PHYSICAL_CORES or os.cpu_count() or 4))
+os.environ.setdefault("MKL_NUM_THREADS", os.environ["OMP_NUM_THREADS"])
+
+import cv2
+import numpy as np
+from PIL import Image
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from turbojpeg import TJPF_RGB, TurboJPEG
+    _TURBOJPEG = TurboJPEG()
+except (ImportError, RuntimeError, OSError):  # optional; also raised when libturbojpeg is missing
+    _TURBOJPEG = None
+
+IMAGE_EXTENSIONS = frozenset({".png", ".jpg", ".jpeg", ".bmp", ".tiff"})
+
+# readtext_batched needs one image size per batch; bulk images are letterboxed
+# onto a square canvas of this side instead of being stretched to it
+BATCH_CANVAS = 1024
+
+# is_blank looks at an area-averaged grey copy at most BLANK_SIDE px across. An
+# image is blank, and not sent to OCR, when fewer than BLANK_MAX_INK of its
+# pixels differ from the median grey level by more than BLANK_DELTA; counting
+# pixels, not measuring spread, keeps a single short word from being dropped
+BLANK_SIDE = 512
+BLANK_DELTA = 32
+BLANK_MAX_INK = 12
+
+def load_image(image_path):
+    """
+    Decode an image file into the RGB array EasyOCR expects.
+
+    Args:
+        image_path (str): The file path to the image.
+
+    Returns:
+        numpy.ndarray: The decoded image, or None if it could not be read.
+    """
+    try:
+        with open(image_path, "rb") as f:
+            data = f.read()
+    except OSError:
+        return None
+    if not data:
+        return None  # imdecode raises on an empty buffer instead of returning None
+    if _TURBOJPEG is not None and image_path.lower().endswith((".jpg", ".jpeg")):
+        try:
+            return _TURBOJPEG.decode(data, pixel_format=TJPF_RGB)
+        except OSError:
+            pass  # e.g. CMYK JPEGs; OpenCV handles those
+    # imdecode, unlike imread, copes with non-ASCII paths on Windows
+    try:
+        img = cv2.imdecode(np.frombuffer(data, dtype=np.uint8), cv2.IMREAD_COLOR)
+    except cv2.error:
+        return None
+    return cv2.cvtColor(img, cv2.COLOR_BGR2RGB) if img is not None else None
+
+def letterbox(images, side=BATCH_CANVAS):
+    """
+    Fit images onto one square canvas without distorting them.
+
+    Each image is scaled down (never up) to fit, keeping its aspect ratio, and
+    padded at the right and bottom with the colour of its adjoining edge, so the
+    padding adds no strong edge for the detector. Box coordinates then refer to
+    the scaled image.
+
+    Args:
+        images (list): RGB images as numpy arrays.
+        side (int): The canvas side in pixels.
+
+    Returns:
+        list: The images, each side x side.
+    """
+    boxed = []
+    for img in images:
+        h, w = img.shape[:2]
+        scale = side / max(h, w)
+        if scale < 1:
+            w, h = max(1, round(w * scale)), max(1, round(h * scale))
+            img = cv2.resize(img, (w, h), interpolation=cv2.INTER_AREA)
+        edge = np.concatenate([img[-1], img[:, -1]]).mean(axis=0)
+        boxed.append(cv2.copyMakeBorder(img, 0, side - h, 0, side - w, cv2.BORDER_CONSTANT,
+                                        value=[int(v) for v in edge]))
+    return boxed
+
+def is_blank(image):
+    """
+    Tell whether a decoded image is nearly uniform, e.g. a blank separator page.
+
+    Args:
+        image (numpy.ndarray): The decoded RGB image.
+
+    Returns:
+        bool: True if there is nothing for OCR to find.
+    """
+    h, w = image.shape[:2]
+    scale = BLANK_SIDE / max(h, w)
+    if scale < 1:
+        # INTER_AREA averages every pixel, so thin strokes fade but don't vanish
+        image = cv2.resize(image, (max(1, round(w * scale)), max(1, round(h * scale))),
+                           interpolation=cv2.INTER_AREA)
+    grey = cv2.cvtColor(image, cv2.COLOR_RGB2GRAY).astype(np.int16)
+    ink = np.count_nonzero(np.abs(grey - int(np.median(grey))) > BLANK_DELTA)
+    return ink < BLANK_MAX_INK
+
+def _build_box_thumbnail():
+    """
+    Build the parallel Numba box filter used by make_thumbnail.
+
+    Numba is imported here rather than at the top since it is slow to import.
+
+    Returns:
+        function: The jitted kernel; it compiles on its first call.
+    """
+    from numba import njit, prange
+
+    @njit(parallel=True, cache=True)
+    def box_thumbnail(image, factor):
+        out_h, out_w, channels = image.shape[0] // factor, image.shape[1] // factor, image.shape[2]
+        out = np.empty((out_h, out_w, channels), dtype=np.uint8)
+        area = factor * factor
+        for y in prange(out_h):
+            for x in range(out_w):
+                for c in range(channels):
+                    total = 0
+                    for dy in range(factor):
+                        for dx in range(factor):
+                            total += image[y * factor + dy, x * factor + dx, c]
+                    out[y, x, c] = total // area
+        return out
+
+    return box_thumbnail
+
+_BOX_THUMBNAIL = None  # the Numba kernel; False once it turned out to be unavailable
+
+def make_thumbnail(image):
+    """
+    Shrink a decoded RGB image to a preview that fits in 250x250.
+
+    With Numba installed, a parallel box filter shrinks large images before Pillow.
+
+    Args:
+        image (numpy.ndarray): The decoded RGB image.
+
+    Returns:
+        PIL.Image.Image: The preview image.
+    """
+    global _BOX_THUMBNAIL
+    # The box filter does the bulk of the reduction without going below 250 px;
+    # Pillow then scales the small result to the exact preview size
+    factor = max(image.shape[:2]) // 250
+    if factor > 1 and _BOX_THUMBNAIL is not False:
+        try:
+            if _BOX_THUMBNAIL is None:
+                _BOX_THUMBNAIL = _build_box_thumbnail()
+            image = _BOX_THUMBNAIL(image, factor)
+        except Exception:
+            # Numba missing, or unable to compile or cache the kernel (frozen builds
+            # have no cache locator); a preview must never fail the OCR job
+            _BOX_THUMBNAIL = False
+    thumbnail = Image.fromarray(image)
+    thumbnail.thumbnail((250, 250))
+    return thumbnail
+
+def decode_chunks(chunks, decoded, stopped):
+    """
+    Decode each chunk of images on a thread pool and queue them in order for OCR.
+
+    Args:
+        chunks (list): Lists of image file paths, one per chunk.
+        decoded (queue.Queue): Receives (chunk_paths, images) pairs, then None.
+        stopped (callable): Returns True once the job has been canceled.
+    """
+    try:
+        with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as executor:
+            for chunk_paths in chunks:
+                if stopped():
+                    break
+                decoded.put((chunk_paths, list(executor.map(load_image, chunk_paths))))
+    finally:
+        decoded.put(None)
+
+def read_text(get_reader, image):
+    """
+    Extract text from one image with EasyOCR.
+
+    Args:
+        get_reader (callable): Returns the reader; load errors become the result text.
+        image (str or numpy.ndarray): The file path to the image, or the decoded RGB image.
+
+    Returns:
+        str: The extracted text, or "Error: ..." if OCR failed.
+    """
+    try:
+        results = get_reader().readtext(image)
+        return "\n".join([result[1] for result in results])
+    except Exception as e:
+        return f"Error: {str(e)}"
+
+def extract_text_batch(get_reader, images):
+    """
+    Extract text from several decoded images in one batched EasyOCR call.
+
+    Args:
+        get_reader (callable): Returns the reader.
+        images (list): RGB images as numpy arrays; None for images that could not be read.
+
+    Returns:
+        tuple: (texts, blanks) - the extracted text for each image, in order,
+        and how many images were skipped as blank.
+    """
+    texts = ["Error: Could not read image"] * len(images)
+    valid = []
+    blanks = 0
+    for i, img in enumerate(images):
+        if img is None:
+            continue
+        if is_blank(img):
+            texts[i] = ""  # skip the detector and recognizer entirely
+            blanks += 1
+        else:
+            valid.append(i)
+    if not valid:
+        return texts, blanks
+    try:
+        batch_results = get_reader().readtext_batched(
+            letterbox([images[i] for i in valid]), batch_size=len(valid))
+        for i, results in zip(valid, batch_results):
+            texts[i] = "\n".join([result[1] for result in results])
+    except Exception:
+        # One bad image fails the whole batch; retry one by one
+        for i in valid:
+            texts[i] = read_text(get_reader, images[i])
+    return texts, blanks
+
+def blank_summary(blanks):
+    """
+    Describe the blank images a bulk job skipped, for its completion message.
+
+    Args:
+        blanks (int): Number of images skipped as blank.
+
+    Returns:
+        str: A sentence to append to the message, or "" if none were skipped.
+    """
+    return f"\n\n{blanks} blank image(s) had no text and were skipped." if blanks else ""
+
+def show_canceled(progress_bar, progress_label):
+    """
+    Reset a Tk progress bar and label after a canceled job; runs on the Tk thread.
+
+    Args:
+        progress_bar (ttk.Progressbar): The job's progress bar.
+        progress_label (tk.Label): The label under it.
+    """
+    progress_bar["value"] = 0
+    progress_label.config(text="Progress: Canceled")
+
+class ExternalDetector:
+    """
+    Base for stand-ins for EasyOCR's CRAFT text detector.
+
+    EasyOCR only calls ``detector(x)`` on a float32 NCHW batch and reads the
+    score maps from the first output, so assigning an instance to
+    ``reader.detector`` leaves readtext/readtext_batched unchanged. Subclasses
+    implement run(), taking and returning numpy arrays.
+    """
+
+    def run(self, x):
+        raise NotImplementedError
+
+    def __call__(self, x):
+        import torch
+        y, feature = self.run(x.cpu().numpy())
+        return torch.from_numpy(y), torch.from_numpy(feature)
+
+def export_detector_onnx(detector, onnx_path):
+    """
+    Export EasyOCR's CRAFT detector to ONNX with dynamic batch and image sizes.
+
+    Args:
+        detector (torch.nn.Module): The reader's detector.
+        onnx_path (str): Where to write the model.
+    """
+    import torch
+    dummy = torch.zeros(1, 3, BATCH_CANVAS, BATCH_CANVAS)
+    with torch.no_grad():
+        torch.onnx.export(
+            detector, dummy, onnx_path + ".tmp", opset_version=13,
+            input_names=["image"], output_names=["y", "feature"],
+            dynamic_axes={"image": {0: "batch", 2: "height", 3: "width"},
+                          "y": {0: "batch", 1: "out_height", 2: "out_width"},
+                          "feature": {0: "batch", 2: "out_height", 3: "out_width"}}
+        )
+    # Rename once complete so an interrupted export can't leave a broken model
+    os.replace(onnx_path + ".tmp", onnx_path)
@@ -1,30 +1,93 @@
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 from PIL import Image, ImageTk
-import easyocr
 import os
+import queue
 import threading
+import time
+
+# Also sets the BLAS thread defaults, so it must come before anything that imports torch
+from ocr_common import (IMAGE_EXTENSIONS, blank_summary, decode_chunks, extract_text_batch,
+                        make_thumbnail, read_text, show_canceled)
 
 # Global variable for stopping the process
 stop_process = False
 
+# Images per readtext_batched call in bulk mode
+BATCH_SIZE = 16
+
+# Decoded chunks waiting for OCR; each holds up to BATCH_SIZE full-size images
+PREFETCH_CHUNKS = 2
+
+# Minimum time between progress/preview redraws (s), so fast OCR can't flood Tk
+PREVIEW_INTERVAL = 0.25
+
+_READER = None
+_READER_LOCK = threading.Lock()  # the Tk and bulk threads may both ask for the reader first
+
+_TORCH_READY = False
+
+def _configure_torch():
+    """
+    Import torch and apply the thread settings, once per process; called under _READER_LOCK.
+
+    torch refuses a second set_num_interop_threads call, so this must not be
+    repeated when a model load fails and is retried.
+    """
+    global _TORCH_READY
+    if not _TORCH_READY:
+        import torch
+        torch.set_num_threads(int(os.environ["OMP_NUM_THREADS"]))
+        torch.set_num_interop_threads(1)
+        _TORCH_READY = True
+
+def _reader():
+    """
+    Return the shared EasyOCR reader, loading the model on first use.
+
+    Returns:
+        easyocr.Reader: The reader instance.
+    """
+    global _READER
+    if _READER is None:
+        with _READER_LOCK:
+            if _READER is None:
+                # torch and easyocr take seconds to import, so they wait for the first OCR
+                # call instead of delaying the window
+                _configure_torch()
+                import easyocr
+                _READER = easyocr.Reader(["en"], gpu=False, quantize=True)
+    return _READER
+
 def extract_text_from_image(image_path):
     """
     Extract text from an image file using EasyOCR.
 
     Args:
-        image_path (str): The file path to the image.
+        image_path (str or numpy.ndarray): The file path to the image, or the decoded RGB image.
 
     Returns:
         str: The extracted text.
     """
-    try:
-        reader = easyocr.Reader(["en"], gpu=False)
-        results = reader.readtext(image_path)
-        text = "\n".join([result[1] for result in results])
-        return text
-    except Exception as e:
-        return f"Error: {str(e)}"
+    return read_text(_reader, image_path)
+
+def show_progress(done, total_files, thumbnail):
+    """
+    Update the progress bar and preview image; runs on the Tk thread via root.after.
+
+    Args:
+        done (int): Number of images processed so far.
+        total_files (int): Total number of images.
+        thumbnail (PIL.Image.Image): Preview of the last processed image, or None.
+    """
+    progress_bar["value"] = done
+    percentage = (done / total_files) * 100
+    progress_label.config(text=f"Progress: {done}/{total_files} ({percentage:.2f}%)")
+
+    if thumbnail is not None:
+        img_tk = ImageTk.PhotoImage(thumbnail)
+        image_label.config(image=img_tk)
+        image_label.image = img_tk
 
 def process_bulk_images(folder_path):
     """
@@ -39,7 +102,10 @@ def process_bulk_images(folder_path):
         messagebox.showerror("Error", "Selected folder is invalid.")
         return
 
-    files = [f for f in os.listdir(folder_path) if f.lower().endswith((".png", ".jpg", ".jpeg", ".bmp", ".tiff"))]
+    # scandir entries carry the file type, so is_file() needs no extra stat call
+    with os.scandir(folder_path) as it:
+        files = [(e.name, e.path) for e in it
+                 if e.is_file() and os.path.splitext(e.name)[1].lower() in IMAGE_EXTENSIONS]
     total_files = len(files)
     if total_files == 0:
         messagebox.showinfo("No Images Found", "No valid image files found in the selected folder.")
@@ -48,36 +114,59 @@ def process_bulk_images(folder_path):
     progress_bar["maximum"] = total_files
     progress_label.config(text=f"Progress: 0/{total_files} (0%)")
 
+    # Load the model before the loop so a failure is reported once, not per image
+    try:
+        _reader()
+    except Exception as e:
+        messagebox.showerror("Error", f"Failed to load OCR model: {str(e)}")
+        return
+
     output_file_path = os.path.join(folder_path, "extracted_texts.txt")
 
+    # Images are decoded on a thread pool while this thread runs OCR on the previous
+    # chunk; widgets are only touched from the Tk thread, through root.after.
+    chunk_files = [files[start:start + BATCH_SIZE] for start in range(0, total_files, BATCH_SIZE)]
+    chunks = [[file_path for _, file_path in chunk] for chunk in chunk_files]
+    decoded = queue.Queue(maxsize=PREFETCH_CHUNKS)
+    threading.Thread(target=decode_chunks, args=(chunks, decoded, lambda: stop_process), daemon=True).start()
+
     with open(output_file_path, "w", encoding="utf-8") as output_file:
-        for i, file_name in enumerate(files):
+        done = 0
+        blank_files = 0
+        last_preview_ts = 0.0
+        for chunk in chunk_files:
+            item = decoded.get()
             if stop_process:
+                # Let the decoder see the stop flag and finish
+                while item is not None:
+                    item = decoded.get()
+                root.after(0, show_canceled, progress_bar, progress_label)
                 messagebox.showinfo("Process Stopped", "The extraction process was canceled.")
-                progress_bar["value"] = 0
-                progress_label.config(text="Progress: Canceled")
                 return
 
-            file_path = os.path.join(folder_path, file_name)
-            extracted_text = extract_text_from_image(file_path)
+            if item is None:
+                # The decoder stopped before the last chunk
+                messagebox.showerror("Error", "Image decoding stopped before all files were processed.")
+                return
+            _, images = item
+            chunk_texts, blanks = extract_text_batch(_reader, images)
+            blank_files += blanks
 
             # Save text to the output file
-            output_file.write(f"{file_name}:\n{extracted_text}\n{'-'*40}\n")
-
-            # Update progress bar and preview image
-            progress_bar["value"] = i + 1
-            percentage = ((i + 1) / total_files) * 100
-            progress_label.config(text=f"Progress: {i + 1}/{total_files} ({percentage:.2f}%)")
-
-            img = Image.open(file_path)
-            img.thumbnail((250, 250))
-            img_tk = ImageTk.PhotoImage(img)
-            image_label.config(image=img_tk)
-            image_label.image = img_tk
-
-            root.update_idletasks()
-
-    messagebox.showinfo("Success", f"All texts have been extracted and saved to {output_file_path}")
+            for (file_name, _), extracted_text in zip(chunk, chunk_texts):
+                output_file.write(f"{file_name}:\n{extracted_text}\n{'-'*40}\n")
+
+            # Update progress bar and preview image with the chunk's last image; the
+            # thumbnail is made here so the Tk thread only wraps it in a PhotoImage
+            done += len(chunk)
+            now = time.monotonic()
+            if done == total_files or now - last_preview_ts > PREVIEW_INTERVAL:
+                last_preview_ts = now
+                thumbnail = make_thumbnail(images[-1]) if images[-1] is not None else None
+                root.after(0, show_progress, done, total_files, thumbnail)
+
+    messagebox.showinfo("Success", f"All texts have been extracted and saved to {output_file_path}"
+                        + blank_summary(blank_files))
     os.startfile(folder_path)  # Open the folder where the file is saved
 
 def open_folder():
@@ -100,7 +189,9 @@ def open_single_file():
 
         # Display the selected image
         img = Image.open(file_path)
-        img.thumbnail((250, 250))
+        # JPEGs are decoded straight at 1/2-1/8 scale instead of full size
+        img.draft("RGB", (256, 256))
+        img.thumbnail((250, 250), Image.Resampling.LANCZOS)
         img_tk = ImageTk.PhotoImage(img)
         image_label.config(image=img_tk)
         image_label.image = img_tk